@@ -10,6 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
+from typing import Any
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
@@ -25,55 +26,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Competitive basketball training and inter-school matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"james@mergington.edu", "lucas@mergington.edu"}
     },
     "Swimming Club": {
         "description": "Swimming techniques and endurance training",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["ava@mergington.edu", "mia@mergington.edu"]
+        "participants": {"ava@mergington.edu", "mia@mergington.edu"}
     },
     "Art Studio": {
         "description": "Painting, drawing, and mixed media art projects",
         "schedule": "Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["isabella@mergington.edu", "charlotte@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "charlotte@mergington.edu"}
     },
     "Drama Club": {
         "description": "Acting, stage performance, and annual theater productions",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["william@mergington.edu", "amelia@mergington.edu"]
+        "participants": {"william@mergington.edu", "amelia@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking skills through competitive debates",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["ethan@mergington.edu", "harper@mergington.edu"]
+        "participants": {"ethan@mergington.edu", "harper@mergington.edu"}
     },
     "Science Olympiad": {
         "description": "Prepare for science competitions and conduct experiments",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["benjamin@mergington.edu", "evelyn@mergington.edu"]
+        "participants": {"benjamin@mergington.edu", "evelyn@mergington.edu"}
     }
 }
 
@@ -84,12 +85,16 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities() -> dict[str, dict[str, Any]]:
+    # Participants are stored as sets for fast lookups; send them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 # validate if student is already signed up for the activity
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str) -> dict[str, str]:
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -105,11 +110,11 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str) -> dict[str, str]:
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
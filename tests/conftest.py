@@ -0,0 +1,16 @@
+"""
+Shared fixtures for the Mergington High School API test suite
+"""
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app, shared across the session"""
+    # Entering the client keeps one event loop portal open for the whole
+    # session instead of starting a new one for every request. No test relies
+    # on following redirects.
+    with TestClient(app, follow_redirects=False) as test_client:
+        yield test_client
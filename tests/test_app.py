@@ -1,92 +1,133 @@
 """
 Test suite for the Mergington High School API
 """
+import types
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import activities
+
+
+# Canonical activities state, restored before each test
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": frozenset({"michael@mergington.edu", "daniel@mergington.edu"})
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": frozenset({"emma@mergington.edu", "sophia@mergington.edu"})
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": frozenset({"john@mergington.edu", "olivia@mergington.edu"})
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball training and inter-school matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 15,
+        "participants": frozenset({"james@mergington.edu", "lucas@mergington.edu"})
+    },
+    "Swimming Club": {
+        "description": "Swimming techniques and endurance training",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": frozenset({"ava@mergington.edu", "mia@mergington.edu"})
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and mixed media art projects",
+        "schedule": "Thursdays, 3:30 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": frozenset({"isabella@mergington.edu", "charlotte@mergington.edu"})
+    },
+    "Drama Club": {
+        "description": "Acting, stage performance, and annual theater productions",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": frozenset({"william@mergington.edu", "amelia@mergington.edu"})
+    },
+    "Debate Team": {
+        "description": "Develop critical thinking and public speaking skills through competitive debates",
+        "schedule": "Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": frozenset({"ethan@mergington.edu", "harper@mergington.edu"})
+    },
+    "Science Olympiad": {
+        "description": "Prepare for science competitions and conduct experiments",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": frozenset({"benjamin@mergington.edu", "evelyn@mergington.edu"})
+    }
+}
+_KEYS = tuple(_ORIGINAL_ACTIVITIES)
+
+SIGNUP = "/activities/{activity}/signup"
+UNREGISTER = "/activities/{activity}/unregister"
+
+
+def signup(client, activity, email):
+    """Sign up a student for an activity through the API"""
+    return client.post(SIGNUP.format(activity=quote(activity)), params={"email": email})
+
 
+def unregister(client, activity, email):
+    """Unregister a student from an activity through the API"""
+    return client.delete(UNREGISTER.format(activity=quote(activity)), params={"email": email})
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+
+def _restore_activities(template):
+    """Overwrite activities in place with fresh copies of the template"""
+    # The set of activities never changes, so overwrite entries in place
+    # rather than clearing and rebuilding the dict
+    for name, details in template.items():
+        activities[name] = {**details, "participants": set(details["participants"])}
+
+
+# Whether activities may have been mutated since the last reset
+_dirty = True
+
+
+@pytest.fixture(scope="session")
+def activities_template():
+    """Read-only view of the canonical activities state"""
+    # Proxy the inner dicts too; participants are already frozensets
+    return types.MappingProxyType({
+        name: types.MappingProxyType(details)
+        for name, details in _ORIGINAL_ACTIVITIES.items()
+    })
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
+def reset_activities(request, activities_template):
     """Reset activities database before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and inter-school matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Swimming techniques and endurance training",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["ava@mergington.edu", "mia@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and mixed media art projects",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["isabella@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting, stage performance, and annual theater productions",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["william@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking skills through competitive debates",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ethan@mergington.edu", "harper@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Prepare for science competitions and conduct experiments",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["benjamin@mergington.edu", "evelyn@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Clean up after test
-    activities.clear()
-    activities.update(original_activities)
+    global _dirty
+    readonly = request.node.get_closest_marker("readonly") is not None
+    # Read-only tests can skip the reset when the previous test left state clean
+    if readonly and not _dirty:
+        return
+    _restore_activities(activities_template)
+    _dirty = not readonly
+
+
+@pytest.fixture(scope="session")
+def activities_payload(client, activities_template):
+    """Fetch GET /activities once per session, from the canonical state"""
+    # Session fixtures are set up before the requesting test's reset, so
+    # restore here rather than capture whatever the previous test left behind
+    _restore_activities(activities_template)
+    return client.get("/activities").json()
 
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
+    @pytest.mark.readonly
     def test_root_redirects_to_static(self, client):
         """Test that root endpoint redirects to static/index.html"""
         response = client.get("/", follow_redirects=False)
@@ -94,6 +135,7 @@ class TestRootEndpoint:
         assert response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.readonly
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
@@ -102,27 +144,18 @@ class TestGetActivities:
         response = client.get("/activities")
         assert response.status_code == 200
     
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, activities_payload):
         """Test that all activities are returned"""
-        response = client.get("/activities")
-        data = response.json()
-        assert len(data) == 9
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Gym Class" in data
-        assert "Basketball Team" in data
-        assert "Swimming Club" in data
-        assert "Art Studio" in data
-        assert "Drama Club" in data
-        assert "Debate Team" in data
-        assert "Science Olympiad" in data
+        assert len(activities_payload) == 9
+
+    @pytest.mark.parametrize("name", _KEYS)
+    def test_activity_present(self, activities_payload, name):
+        """Test that each expected activity is returned"""
+        assert name in activities_payload
     
-    def test_get_activities_has_correct_structure(self, client):
+    def test_get_activities_has_correct_structure(self, activities_payload):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_data in data.items():
+        for activity_name, activity_data in activities_payload.items():
             assert "description" in activity_data
             assert "schedule" in activity_data
             assert "max_participants" in activity_data
@@ -148,9 +181,7 @@ class TestSignupForActivity:
     
     def test_signup_for_existing_activity_success(self, client):
         """Test successful signup for an existing activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
-        )
+        response = signup(client, "Chess Club", "newstudent@mergington.edu")
         assert response.status_code == 200
         assert response.json() == {
             "message": "Signed up newstudent@mergington.edu for Chess Club"
@@ -159,25 +190,33 @@ class TestSignupForActivity:
     def test_signup_adds_student_to_participants(self, client):
         """Test that signup actually adds the student to participants list"""
         email = "newstudent@mergington.edu"
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        signup(client, "Chess Club", email)
         
         # Verify student was added
-        response = client.get("/activities")
-        chess_club = response.json()["Chess Club"]
-        assert email in chess_club["participants"]
+        assert email in activities["Chess Club"]["participants"]
+    
+    def test_signup_appears_in_activities_sorted(self, client):
+        """Test that a signup is returned by GET /activities in sorted order"""
+        response = signup(client, "Chess Club", "aaa@mergington.edu")
+        assert response.status_code == 200
+        
+        participants = client.get("/activities").json()["Chess Club"]["participants"]
+        assert participants == [
+            "aaa@mergington.edu",
+            "daniel@mergington.edu",
+            "michael@mergington.edu"
+        ]
     
     def test_signup_for_nonexistent_activity_returns_404(self, client):
         """Test that signing up for a non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
-        )
+        response = signup(client, "Nonexistent Club", "student@mergington.edu")
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
     
     def test_signup_when_already_registered_returns_400(self, client):
         """Test that signing up when already registered returns 400"""
         email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.post(f"/activities/Chess Club/signup?email={email}")
+        response = signup(client, "Chess Club", email)
         assert response.status_code == 400
         assert response.json()["detail"] == "Student already signed up for this activity"
     
@@ -186,24 +225,20 @@ class TestSignupForActivity:
         email = "multisport@mergington.edu"
         
         # Sign up for Chess Club
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
+        response1 = signup(client, "Chess Club", email)
         assert response1.status_code == 200
         
         # Sign up for Programming Class
-        response2 = client.post(f"/activities/Programming Class/signup?email={email}")
+        response2 = signup(client, "Programming Class", email)
         assert response2.status_code == 200
         
         # Verify both signups
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert email in data["Chess Club"]["participants"]
-        assert email in data["Programming Class"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+        assert email in activities["Programming Class"]["participants"]
     
     def test_signup_with_special_characters_in_activity_name(self, client):
         """Test signup with URL-encoded activity names"""
-        response = client.post(
-            "/activities/Programming%20Class/signup?email=coder@mergington.edu"
-        )
+        response = signup(client, "Programming Class", "coder@mergington.edu")
         assert response.status_code == 200
 
 
@@ -213,7 +248,7 @@ class TestUnregisterFromActivity:
     def test_unregister_from_activity_success(self, client):
         """Test successful unregistration from an activity"""
         email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.delete(f"/activities/Chess Club/unregister?email={email}")
+        response = unregister(client, "Chess Club", email)
         assert response.status_code == 200
         assert response.json() == {
             "message": f"Unregistered {email} from Chess Club"
@@ -222,25 +257,21 @@ class TestUnregisterFromActivity:
     def test_unregister_removes_student_from_participants(self, client):
         """Test that unregister actually removes the student from participants list"""
         email = "michael@mergington.edu"
-        client.delete(f"/activities/Chess Club/unregister?email={email}")
+        unregister(client, "Chess Club", email)
         
         # Verify student was removed
-        response = client.get("/activities")
-        chess_club = response.json()["Chess Club"]
-        assert email not in chess_club["participants"]
+        assert email not in activities["Chess Club"]["participants"]
     
     def test_unregister_from_nonexistent_activity_returns_404(self, client):
         """Test that unregistering from a non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=student@mergington.edu"
-        )
+        response = unregister(client, "Nonexistent Club", "student@mergington.edu")
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
     
     def test_unregister_when_not_registered_returns_400(self, client):
         """Test that unregistering when not registered returns 400"""
         email = "notregistered@mergington.edu"
-        response = client.delete(f"/activities/Chess Club/unregister?email={email}")
+        response = unregister(client, "Chess Club", email)
         assert response.status_code == 400
         assert response.json()["detail"] == "Student not signed up for this activity"
     
@@ -249,27 +280,23 @@ class TestUnregisterFromActivity:
         email = "workflow@mergington.edu"
         
         # Sign up
-        signup_response = client.post(f"/activities/Drama Club/signup?email={email}")
+        signup_response = signup(client, "Drama Club", email)
         assert signup_response.status_code == 200
         
         # Verify signup
-        activities = client.get("/activities").json()
         assert email in activities["Drama Club"]["participants"]
         
         # Unregister
-        unregister_response = client.delete(f"/activities/Drama Club/unregister?email={email}")
+        unregister_response = unregister(client, "Drama Club", email)
         assert unregister_response.status_code == 200
         
         # Verify unregistration
-        activities = client.get("/activities").json()
         assert email not in activities["Drama Club"]["participants"]
     
     def test_unregister_with_special_characters_in_activity_name(self, client):
         """Test unregister with URL-encoded activity names"""
         email = "emma@mergington.edu"  # Already in Programming Class
-        response = client.delete(
-            "/activities/Programming%20Class/unregister?email=" + email
-        )
+        response = unregister(client, "Programming Class", email)
         assert response.status_code == 200
 
 
@@ -278,9 +305,7 @@ class TestEdgeCases:
     
     def test_activity_names_are_case_sensitive(self, client):
         """Test that activity names are case-sensitive"""
-        response = client.post(
-            "/activities/chess club/signup?email=student@mergington.edu"
-        )
+        response = signup(client, "chess club", "student@mergington.edu")
         assert response.status_code == 404
     
     def test_multiple_students_can_join_same_activity(self, client):
@@ -292,11 +317,10 @@ class TestEdgeCases:
         ]
         
         for email in emails:
-            response = client.post(f"/activities/Art Studio/signup?email={email}")
+            response = signup(client, "Art Studio", email)
             assert response.status_code == 200
         
         # Verify all were added
-        activities = client.get("/activities").json()
         art_studio = activities["Art Studio"]
         for email in emails:
             assert email in art_studio["participants"]
@@ -306,15 +330,14 @@ class TestEdgeCases:
         email = "rejoin@mergington.edu"
         
         # First signup
-        client.post(f"/activities/Swimming Club/signup?email={email}")
+        signup(client, "Swimming Club", email)
         
         # Unregister
-        client.delete(f"/activities/Swimming Club/unregister?email={email}")
+        unregister(client, "Swimming Club", email)
         
         # Signup again
-        response = client.post(f"/activities/Swimming Club/signup?email={email}")
+        response = signup(client, "Swimming Club", email)
         assert response.status_code == 200
         
         # Verify in participants
-        activities = client.get("/activities").json()
         assert email in activities["Swimming Club"]["participants"]